@@ -1,6 +1,8 @@
 # diagnostic.py
 import numpy as np
 
+from model import M0_REFERENCE as M0
+
 # Golden ratio
 phi = (1 + np.sqrt(5)) / 2
 print(f"Golden ratio φ = {phi:.10f}")
@@ -9,18 +11,11 @@ print(f"φ⁻² = {1/phi**2:.10f}")
 
 print("\n" + "="*60)
 
-# Your M₀ matrix from the output
-M0 = np.array([
-    [-1.15470054, -0.57735027, -0.61803399],
-    [-0.57735027,  0.71364418, -0.38196601],
-    [-0.61803399, -0.38196601,  0.44105636]
-])
-
 print("1. YOUR M₀ MATRIX:")
 print(M0)
 
 print("\n2. EIGENVALUES:")
-eigvals = np.linalg.eigvals(M0)
+eigvals = np.linalg.eigvalsh(M0)  # M₀ is real symmetric
 print(f"   λ₁ = {eigvals[0]:.6f}")
 print(f"   λ₂ = {eigvals[1]:.6f}")
 print(f"   λ₃ = {eigvals[2]:.6f}")
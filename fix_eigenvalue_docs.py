@@ -1,12 +1,33 @@
 # fix_eigenvalue_docs.py
 import re
 
+# Patterns are compiled once; each one is written so that it no longer
+# matches after its replacement, which makes the script safe to rerun.
+PATTERN = re.compile(r'paper_eigvals\s*=\s*np\.array\(\[[^\]]+\]\)(?:  # Exact computed values)?')
+NO_DOCSTRING = re.compile(r'\A(?!""")')
+CLASS_A5 = re.compile(r'^class A5ModularForms:\n(?!    """\n    Implementation of A5)', re.MULTILINE)
+
+
+def _patch(path, transforms):
+    """Apply (compiled_pattern, replacement) pairs; write only on change."""
+    with open(path, 'r') as f:
+        content = f.read()
+
+    patched = content
+    for pattern, replacement in transforms:
+        patched = pattern.sub(replacement, patched)
+
+    if patched == content:
+        return False
+
+    with open(path, 'w') as f:
+        f.write(patched)
+    return True
+
+
 print("Fixing eigenvalue documentation...")
 
 # 1. Update verify_results.py
-with open('verify_results.py', 'r') as f:
-    content = f.read()
-
 # Add documentation at the top
 header = '''"""
 Golden Ratio Modular Flavor Symmetry - Verification Script
@@ -24,44 +45,31 @@ Both preserve the golden ratio hierarchy pattern.
 
 '''
 
-# Check if header already exists
-if not content.startswith('"""'):
-    content = header + content
-
-# Update the paper_eigvals line
-content = re.sub(
-    r'paper_eigvals\s*=\s*np\.array\(\[[^\]]+\]\)',
-    'paper_eigvals = np.array([-1.56426517, 0.57099458, 0.99327059])  # Exact computed values',
-    content
-)
-
-with open('verify_results.py', 'w') as f:
-    f.write(content)
-
-print("✅ Updated verify_results.py")
+# Prepend the header only if the file has no module docstring yet, and
+# update the paper_eigvals line
+if _patch('verify_results.py', [
+    (NO_DOCSTRING, header),
+    (PATTERN, 'paper_eigvals = np.array([-1.56426517, 0.57099458, 0.99327059])  # Exact computed values'),
+]):
+    print("✅ Updated verify_results.py")
+else:
+    print("✓ verify_results.py already up to date")
 
 # 2. Update model.py
-with open('model.py', 'r') as f:
-    model_content = f.read()
-
 # Add note to class docstring
-if 'class A5ModularForms' in model_content:
-    # Find the class and add note
-    model_content = model_content.replace(
-        'class A5ModularForms:',
-        '''class A5ModularForms:
+if _patch('model.py', [
+    (CLASS_A5, '''class A5ModularForms:
     """
     Implementation of A5 modular forms at τ₀ = e^(2πi/5).
     
     EIGENVALUE NOTE: Computes exact values. Paper shows approximations.
     See verify_results.py for details.
-    """'''
-    )
-    
-    with open('model.py', 'w') as f:
-        f.write(model_content)
-    
+    """
+'''),
+]):
     print("✅ Updated model.py")
+else:
+    print("✓ model.py already up to date")
 
 # 3. Create EIGENVALUE_NOTES.md
 notes = '''# Eigenvalue Discrepancy Explanation
@@ -95,8 +103,16 @@ shows approximate values. Both are mathematically consistent.
 - Code: model.py, verify_results.py
 '''
 
-with open('EIGENVALUE_NOTES.md', 'w') as f:
-    f.write(notes)
-
-print("✅ Created EIGENVALUE_NOTES.md")
+try:
+    with open('EIGENVALUE_NOTES.md', 'r') as f:
+        notes_current = f.read() == notes
+except FileNotFoundError:
+    notes_current = False
+
+if notes_current:
+    print("✓ EIGENVALUE_NOTES.md already up to date")
+else:
+    with open('EIGENVALUE_NOTES.md', 'w') as f:
+        f.write(notes)
+    print("✅ Created EIGENVALUE_NOTES.md")
 print("\nNow run: python verify_results.py --all")
\ No newline at end of file
@@ -7,17 +7,15 @@ Run this in your repository directory:
 This will create: PAPER_CORRECTIONS.txt with updated LaTeX sections.
 """
 
-import numpy as np
-from model import (
-    A5ModularForms,
-    GoldenYukawaMatrix,
-    HierarchicalYukawa,
-    PHI, PHI_INV, PHI_INV2
-)
+import argparse
+
+# NumPy and the model are imported inside the generators, so that
+# `--help` returns without paying for their initialization.
 
 
 def generate_eigenvalue_section():
     """Generate corrected Section 3.3 with actual eigenvalues."""
+    from model import GoldenYukawaMatrix, PHI_INV, PHI_INV2
     
     matrix = GoldenYukawaMatrix()
     eigenvalues, _ = matrix.get_eigenvalues()
@@ -51,6 +49,8 @@ where $\phi^{-1} = %.3f$ and $\phi^{-2} = %.3f$. The overall sign of $\lambda_1$
 
 def generate_table2():
     """Generate corrected Table 2 with actual hierarchical patterns."""
+    import numpy as np
+    from model import HierarchicalYukawa, WeightScan
     
     hierarchical = HierarchicalYukawa()
     
@@ -61,7 +61,7 @@ def generate_table2():
         (4, 2, 0)
     ]
     
-    latex = r"""
+    header = r"""
 \begin{table}[h]
 \centering
 \caption{Hierarchical patterns from modular weight assignments}
@@ -71,28 +71,29 @@ Weight Assignment $(k_1, k_2, k_3)$ & Yukawa Scaling & Ratio $y_1 : y_2 : y_3$ &
 \hline
 """
     
-    for weights in patterns:
-        masses = hierarchical.get_mass_hierarchy(weights, coupling=1.0)
-        ratios = masses / masses[0]
-        span = hierarchical.compute_hierarchy_span(weights)
-        
-        # Format the scaling pattern
-        k1, k2, k3 = weights
-        scaling = f"$\\phi^{{-{k1}}} : \\phi^{{-{k2}}} : \\phi^{{-{k3}}}$"
-        
-        latex += f"({k1}, {k2}, {k3}) & {scaling} & 1 : {ratios[1]:.3f} : {ratios[2]:.3f} & $\\sim$ {span:.1f} \\\\\n"
-    
-    latex += r"""\hline
+    footer = r"""\hline
 \end{tabular}
 \label{tab:hierarchies}
 \end{table}
 """
     
-    return latex
+    # One batched evaluation for all rows: masses and spans together
+    scan = hierarchical.scan(WeightScan(np.array(patterns)), coupling=1.0)
+    ratios_batch = scan.masses / scan.masses[:, :1]
+    
+    rows = [
+        f"({k1}, {k2}, {k3}) & $\\phi^{{-{k1}}} : \\phi^{{-{k2}}} : \\phi^{{-{k3}}}$ & "
+        f"1 : {r2:.3f} : {r3:.3f} & $\\sim$ {span:.1f} \\\\\n"
+        for (k1, k2, k3), (_, r2, r3), span in zip(patterns, ratios_batch, scan.spans)
+    ]
+    
+    return header + "".join(rows) + footer
 
 
 def generate_numerical_values_appendix():
     """Generate Appendix C with exact numerical values."""
+    import numpy as np
+    from model import A5ModularForms, GoldenYukawaMatrix
     
     forms = A5ModularForms()
     matrix = GoldenYukawaMatrix()
@@ -158,6 +159,11 @@ with corresponding normalized ratios:
 
 def main():
     """Generate all corrections and save to file."""
+    parser = argparse.ArgumentParser(
+        description='Generate corrected LaTeX sections (PAPER_CORRECTIONS.txt) '
+                    'from the computed values'
+    )
+    parser.parse_args()
     
     print("="*70)
     print("  GENERATING PAPER CORRECTIONS")
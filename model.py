@@ -6,8 +6,13 @@ This module implements the calculations from:
 by Marvin Gentry (2025)
 """
 
+import functools
+import math
+import operator
+import types
+
 import numpy as np
-from typing import Tuple, Dict
+from typing import Tuple, Mapping, Optional
 from dataclasses import dataclass
 
 # Golden ratio and related constants
@@ -15,9 +20,306 @@ PHI = (1 + np.sqrt(5)) / 2  # φ = 1.618...
 PHI_INV = 1 / PHI           # φ⁻¹ = 0.618...
 PHI_INV2 = 1 / (PHI**2)     # φ⁻² = 0.382...
 
+# Universal golden matrix M₀ (Equation 3.2): Equation (3.1) with the
+# Y ratios at τ₀ substituted. A constant of the theory, built once.
+_SQRT3 = np.sqrt(3.0)
+_M0_CONST = np.array([
+    [-2/_SQRT3,           -1/_SQRT3,        -PHI_INV],
+    [-1/_SQRT3,      2*PHI_INV/_SQRT3,       -PHI_INV2],
+    [-PHI_INV,          -PHI_INV2,   2*PHI_INV2/_SQRT3]
+], dtype=np.float64)
+_M0_CONST.setflags(write=False)
+
+# Public read-only M₀ for the standalone diagnostic scripts
+M0_REFERENCE = _M0_CONST
+
 # The golden point τ₀ = exp(2πi/5)
 TAU_0 = np.exp(2j * np.pi / 5)
 
+# Y ratios at τ₀ (Theorem 1), shared read-only by every A5ModularForms
+_Y_RATIOS = np.array([1.0, PHI_INV, PHI_INV2, -PHI_INV2, -PHI_INV])
+_Y_RATIOS.setflags(write=False)
+
+# Residual of Corollary 2, Y₄ + Y₅ = -1, fixed once the Y ratios are known
+_STABILIZER_RESIDUAL = abs(_Y_RATIOS[3] + _Y_RATIOS[4] + 1.0)
+
+# Lookup table _PHI_POW[k] = φ^{-k/2} for the per-field suppression factors
+_PHI_POW = PHI ** (-np.arange(0, 64) / 2)
+_PHI_POW.setflags(write=False)
+
+# Public read-only lookup table for the standalone diagnostic scripts
+PHI_POW = _PHI_POW
+
+# Relative eigenvalue gap below which the closed-form solvers defer to LAPACK
+_LAPACK_GAP_RTOL = 1e-2
+
+
+def _weight_suppression(k: np.ndarray) -> np.ndarray:
+    """
+    Suppression matrices φ^{-(k_i + k_j)/2} for weight assignments k.
+
+    Formed as the outer product of the per-field factors φ^{-k_i/2},
+    read from _PHI_POW when the weights are integers inside the table.
+    This is the single source for every Yukawa construction in this
+    module.
+
+    Args:
+        k: Weights of shape (..., 3)
+
+    Returns:
+        Array of shape (..., 3, 3)
+    """
+    in_table = k.size == 0 or (k.min() >= 0 and k.max() < len(_PHI_POW))
+    if k.dtype.kind in 'iu' and in_table:
+        v = _PHI_POW[k]
+    else:
+        v = PHI ** (-k / 2)
+    return v[..., :, None] * v[..., None, :]
+
+
+def _physical_yukawa(weights: Tuple[int, int, int], coupling: float) -> np.ndarray:
+    """
+    Body of HierarchicalYukawa.compute_physical_yukawa, read-only result.
+
+    Depends only on its arguments, so it is memoized at module level
+    rather than per instance.
+    """
+    suppression = _weight_suppression(np.array(weights))
+    
+    # Element-wise multiplication
+    Y_phys = coupling * _M0_CONST * suppression
+    Y_phys.setflags(write=False)
+    
+    return Y_phys
+
+
+_physical_yukawa_cached = functools.lru_cache(maxsize=64)(_physical_yukawa)
+
+
+def _eigvalsh_3x3(M: np.ndarray) -> np.ndarray:
+    """
+    Closed-form eigenvalues of a real symmetric 3x3 matrix.
+
+    Trigonometric solution of the characteristic cubic (Smith 1961) on
+    the shifted matrix B = (M - qI)/p with q = tr(M)/3, as in the batched
+    solver. Avoids the LAPACK dispatch that dominates the cost of
+    np.linalg.eigh at this size. Written in the subset of Python that
+    Numba compiles: model_jit builds the scan kernel's copy from it.
+
+    The trigonometric roots are only accurate to ~ε·|λ_max|. For graded
+    matrices such as Y = D M₀ D the two smaller eigenvalues are recovered
+    from the invariants c₂ (sum of principal 2x2 minors) and c₃ = det M,
+    which keep their relative accuracy under diagonal scaling. A running
+    bound on the rounding error of c₂ and c₃ decides which roots to keep;
+    near a repeated root neither is reliable and LAPACK is used.
+
+    Args:
+        M: Real symmetric 3x3 matrix
+
+    Returns:
+        Array of 3 real eigenvalues in ascending order
+    """
+    a, b, c = M[0, 0], M[0, 1], M[0, 2]
+    d, e = M[1, 1], M[1, 2]
+    f = M[2, 2]
+
+    c2 = (a*d - b*b) + (a*f - c*c) + (d*f - e*e)
+    c3 = a*(d*f - e*e) - b*(b*f - c*e) + c*(b*e - c*d)
+
+    # The same sums in absolute value bound the rounding error of c₂, c₃
+    t2 = abs(a*d) + b*b + abs(a*f) + c*c + abs(d*f) + e*e
+    t3 = (abs(a)*(abs(d*f) + e*e) + abs(b)*(abs(b*f) + abs(c*e))
+          + abs(c)*(abs(b*e) + abs(c*d)))
+
+    q = (a + d + f) / 3
+    off = b*b + c*c + e*e
+    p = math.sqrt(((a - q)**2 + (d - q)**2 + (f - q)**2 + 2*off) / 6)
+
+    if p == 0.0:
+        # Triple root: M is a multiple of the identity
+        return np.array([q, q, q])
+
+    # r = det(B)/2 lies in [-1, 1] up to rounding
+    a, d, f = (a - q) / p, (d - q) / p, (f - q) / p
+    b, c, e = b / p, c / p, e / p
+    r = (a*(d*f - e*e) - b*(b*f - c*e) + c*(b*e - c*d)) / 2
+    phi = math.acos(min(1.0, max(-1.0, r))) / 3
+
+    largest = q + 2*p*math.cos(phi)
+    smallest = q + 2*p*math.cos(phi + 2*math.pi/3)
+
+    # The other two roots solve x² - s x + prod = 0 with s and prod taken
+    # from c₂, c₃ and the dominant root; use them when that root is well
+    # separated and their error bound is within a few ulps of |big|, the
+    # accuracy of the trigonometric roots
+    big = smallest if abs(smallest) > abs(largest) else largest
+    mid = 3*q - largest - smallest
+    prod = c3 / big
+    s = (c2 - prod) / big
+    gap = math.sqrt(max(s*s - 4*prod, 0.0))
+    x1 = (s + math.copysign(gap, s)) / 2
+    if x1 != 0.0 and abs(big - mid) > _LAPACK_GAP_RTOL * abs(big):
+        eps = 2.220446049250313e-16
+        dprod = eps * t3 / abs(big)
+        ds = (eps * t2 + dprod) / abs(big)
+        ddisc = 2*abs(s)*ds + 4*dprod
+        err = ds + ddisc / (gap + math.sqrt(ddisc)) + dprod / abs(x1)
+        if err <= 4 * eps * abs(big):
+            lo, mid, hi = big, x1, prod / x1
+            if lo > mid:
+                lo, mid = mid, lo
+            if mid > hi:
+                mid, hi = hi, mid
+            if lo > mid:
+                lo, mid = mid, lo
+            return np.array([lo, mid, hi])
+
+    # Near a repeated root the trigonometric roots are only good to ~√ε
+    if min(mid - smallest, largest - mid) <= _LAPACK_GAP_RTOL * abs(big):
+        return np.linalg.eigvalsh(M)
+
+    return np.array([smallest, mid, largest])
+
+
+# Public closed-form solver for the standalone diagnostic scripts
+eigvalsh_3x3 = _eigvalsh_3x3
+
+
+def _eigh_3x3(M: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form eigendecomposition of a real symmetric 3x3 matrix.
+
+    Eigenvectors are columns of the adjugate Adj(λI - M), built with the
+    Souriau-Faddeev-Frame recursion
+        Adj(λI - M) = λ²I + λB₁ + B₂,  B₁ = M + p₁I,  B₂ = MB₁ + p₂I.
+    Falls back to np.linalg.eigh for degenerate or nearly degenerate
+    spectra, where the adjugate vanishes.
+
+    Args:
+        M: Real symmetric 3x3 matrix
+
+    Returns:
+        (eigenvalues, eigenvectors) in the same convention as np.linalg.eigh
+    """
+    eigenvalues = _eigvalsh_3x3(M)
+
+    # Near a repeated root the closed-form eigenvalues are only good to
+    # ~√ε·|λ|max and the adjugate columns lose all accuracy, so close
+    # spectra go to LAPACK; the test is relative to the spectrum's scale
+    scale = np.abs(eigenvalues).max()
+    if np.diff(eigenvalues).min() <= _LAPACK_GAP_RTOL * scale:
+        return np.linalg.eigh(M)
+
+    I = np.eye(3)
+    p1 = -np.trace(M)
+    B1 = M + p1 * I
+    B2 = M @ B1 + 0.5 * (p1 * p1 - np.trace(M @ M)) * I
+
+    # adj[n] = Adj(λₙI - M); any nonzero column is an eigenvector for λₙ
+    lam = eigenvalues[:, None, None]
+    adj = lam * lam * I + lam * B1 + B2
+    norms = (adj * adj).sum(axis=1)
+    cols = norms.argmax(axis=1)
+    best = norms[[0, 1, 2], cols]
+
+    eigenvectors = adj[[0, 1, 2], :, cols].T / np.sqrt(best)
+
+    return eigenvalues, eigenvectors
+
+
+def _eigvalsh_3x3_batch(M: np.ndarray) -> np.ndarray:
+    """
+    Closed-form eigenvalues of a stack of real symmetric 3x3 matrices.
+
+    Vectorized trigonometric solution on the shifted matrix
+    B = (M - qI)/p with q = tr(M)/3, which keeps the cubic well scaled,
+    with the smaller roots recovered from the invariants and nearly
+    degenerate rows handed to LAPACK as in _eigvalsh_3x3. The arithmetic
+    stays in the dtype of M, so float32 input is solved in float32.
+
+    Args:
+        M: Array of shape (N, 3, 3)
+
+    Returns:
+        Array of shape (N, 3), eigenvalues per row in ascending order
+    """
+    a, b, c = M[:, 0, 0], M[:, 0, 1], M[:, 0, 2]
+    d, e = M[:, 1, 1], M[:, 1, 2]
+    f = M[:, 2, 2]
+
+    q = (a + d + f) / 3
+    bb, cc, ee = b*b, c*c, e*e
+    p = np.sqrt(((a - q)**2 + (d - q)**2 + (f - q)**2 + 2*(bb + cc + ee)) / 6)
+
+    # p = 0 only for multiples of the identity; any finite r works there
+    p_safe = np.where(p > 0, p, 1)
+    a_, d_, f_ = (a - q) / p_safe, (d - q) / p_safe, (f - q) / p_safe
+    b_, c_, e_ = b / p_safe, c / p_safe, e / p_safe
+    r = (a_*(d_*f_ - e_*e_) - b_*(b_*f_ - c_*e_) + c_*(b_*e_ - c_*d_)) / 2
+    phi = np.arccos(np.clip(r, -1, 1)) / 3
+
+    out = np.empty(M.shape[:1] + (3,), dtype=M.dtype)
+    out[:, 2] = q + 2*p*np.cos(phi)
+    out[:, 0] = q + 2*p*np.cos(phi + 2*np.pi/3)
+    out[:, 1] = 3*q - out[:, 0] - out[:, 2]
+
+    ad, af, df = a*d, a*f, d*f
+    bf, ce, be, cd = b*f, c*e, b*e, c*d
+    c2 = (ad - bb) + (af - cc) + (df - ee)
+    c3 = a*(df - ee) - b*(bf - ce) + c*(be - cd)
+    t2 = np.abs(ad) + bb + np.abs(af) + cc + np.abs(df) + ee
+    t3 = (np.abs(a)*(np.abs(df) + ee) + np.abs(b)*(np.abs(bf) + np.abs(ce))
+          + np.abs(c)*(np.abs(be) + np.abs(cd)))
+
+    big = np.where(np.abs(out[:, 0]) > np.abs(out[:, 2]), out[:, 0], out[:, 2])
+    abig = np.abs(big)
+    eps = np.finfo(M.dtype).eps
+    with np.errstate(divide='ignore', invalid='ignore'):
+        prod = c3 / big
+        s = (c2 - prod) / big
+        gap = np.sqrt(np.maximum(s*s - 4*prod, 0))
+        x1 = (s + np.copysign(gap, s)) / 2
+        dprod = eps * t3 / abig
+        ds = (eps * t2 + dprod) / abig
+        ddisc = 2*np.abs(s)*ds + 4*dprod
+        err = ds + ddisc / (gap + np.sqrt(ddisc)) + dprod / np.abs(x1)
+        use = ((np.abs(big - out[:, 1]) > _LAPACK_GAP_RTOL * abig)
+               & (err <= 4 * eps * abig))
+        x2 = prod / np.where(use, x1, 1)
+
+    # Sorting network on (big, x1, x2) for the rows that keep them
+    u, v = np.minimum(big, x1), np.maximum(big, x1)
+    w = np.maximum(u, x2)
+    np.copyto(out[:, 0], np.minimum(u, x2), where=use)
+    np.copyto(out[:, 1], np.minimum(w, v), where=use)
+    np.copyto(out[:, 2], np.maximum(w, v), where=use)
+
+    rest = np.flatnonzero(~use)
+    if rest.size:
+        roots = out[rest]
+        near = np.diff(roots, axis=1).min(axis=1) <= _LAPACK_GAP_RTOL * abig[rest]
+        if near.any():
+            out[rest[near]] = np.linalg.eigvalsh(M[rest[near]])
+
+    return out
+
+
+# Scans with at least this many patterns use the Numba kernel when Numba
+# is installed. Importing Numba and loading the cached kernel takes ~0.5 s
+# per process, about what the vectorized NumPy solver needs for a million
+# rows, so smaller scans (Table 2, the verifier) never pay for it
+_JIT_MIN_ROWS = 1_000_000
+
+
+@functools.lru_cache(maxsize=1)
+def _jit_scan_kernel():
+    """model_jit.scan_hierarchy, imported on first use; None without Numba."""
+    try:
+        from model_jit import scan_hierarchy
+    except ImportError:
+        return None
+    return scan_hierarchy
+
 
 @dataclass
 class ModularPoint:
@@ -36,6 +338,45 @@ class ModularPoint:
         return f"τ = {self.real:.6f} + {self.imag:.6f}i"
 
 
+@dataclass
+class WeightScan:
+    """
+    Scan over modular weight assignments in structure-of-arrays layout.
+    
+    Each quantity is one contiguous array with the pattern index first,
+    so a scan is evaluated with whole-array operations rather than one
+    small allocation per pattern. Y, masses and spans are output buffers
+    filled by HierarchicalYukawa.scan.
+    
+    Attributes:
+        weights: Integer array (N, 3) of (k_1, k_2, k_3) assignments
+        Y: Physical Yukawa matrices, shape (N, 3, 3)
+        masses: Mass eigenvalues sorted descending, shape (N, 3)
+        spans: Hierarchy spans log₁₀(m_heaviest/m_lightest), shape (N,)
+        dtype: Float type of the output buffers
+    """
+    weights: np.ndarray
+    Y: Optional[np.ndarray] = None
+    masses: Optional[np.ndarray] = None
+    spans: Optional[np.ndarray] = None
+    dtype: type = np.float64
+    
+    def __post_init__(self):
+        weights = np.asarray(self.weights)
+        # Casting would silently truncate non-integer weights
+        integral = weights.dtype.kind in 'iu' or np.array_equal(weights, np.round(weights))
+        if not integral:
+            raise ValueError("Modular weights must be integers")
+        self.weights = np.ascontiguousarray(weights, dtype=np.int64)
+        n_patterns = len(self.weights)
+        if self.Y is None:
+            self.Y = np.empty((n_patterns, 3, 3), dtype=self.dtype)
+        if self.masses is None:
+            self.masses = np.empty((n_patterns, 3), dtype=self.dtype)
+        if self.spans is None:
+            self.spans = np.empty(n_patterns, dtype=self.dtype)
+
+
 class A5ModularForms:
     """
     A5 modular forms at the golden point τ₀ = exp(2πi/5).
@@ -58,9 +399,9 @@ class A5ModularForms:
             normalize: If True, set Y₁ = 1
             
         Returns:
-            Array of 5 complex numbers (real at τ₀)
+            Array of 5 complex numbers (real at τ₀), read-only
         """
-        Y = np.array([1.0, PHI_INV, PHI_INV2, -PHI_INV2, -PHI_INV])
+        Y = _Y_RATIOS
         
         if not normalize:
             # Include an overall normalization factor
@@ -78,25 +419,31 @@ class A5ModularForms:
         # This is a placeholder - exact value requires q-expansion
         return 1.0
     
-    def verify_stabilizer_condition(self) -> bool:
+    @functools.cached_property
+    def stabilizer_condition_holds(self) -> bool:
         """
-        Verify that Y(τ₀) satisfies the Z₅ stabilizer condition.
+        Whether Y(τ₀) satisfies the Z₅ stabilizer condition.
         
-        Returns:
-            True if the stabilizer equation is satisfied
+        τ₀ is fixed, so the check runs once per instance and is then a
+        plain attribute lookup.
         """
-        Y = self.get_Y_ratios()
-        
         # The transformation g: τ → -1/(τ+1) should leave τ₀ invariant
         # and Y should transform according to ρ⁽⁵⁾(g)Y = Y
         
         # For the 5 representation of A₅, we check Equation (2.1)
         # This is satisfied by construction at τ₀
         
-        # Check Corollary 2: Y₄ + Y₅ = -1
-        corollary_check = np.abs(Y[3] + Y[4] + 1.0) < 1e-10
+        # Check Corollary 2: Y₄ + Y₅ = -1 (residual precomputed at import)
+        return bool(_STABILIZER_RESIDUAL < 1e-10)
+    
+    def verify_stabilizer_condition(self) -> bool:
+        """
+        Verify that Y(τ₀) satisfies the Z₅ stabilizer condition.
         
-        return corollary_check
+        Returns:
+            True if the stabilizer equation is satisfied
+        """
+        return self.stabilizer_condition_holds
     
     def compute_modular_weight_suppression(self, weight: int) -> float:
         """
@@ -113,7 +460,39 @@ class A5ModularForms:
         if weight < 2:
             raise ValueError("Modular weight must be at least 2")
         
+        # Integer weights come from the φ-power table, as in suppression_array
+        if isinstance(weight, (int, np.integer)) and weight - 2 < len(_PHI_POW):
+            return float(_PHI_POW[weight - 2])
+        
         return PHI ** (-(weight - 2) / 2)
+    
+    def suppression_array(
+        self,
+        weights: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized compute_modular_weight_suppression over many weights.
+        
+        Integer weights are gathered from the φ-power lookup table, so
+        no pow is evaluated; other weights use a single np.power call.
+        
+        Args:
+            weights: Array of modular weights w
+            out: Optional float array to write the result into
+            
+        Returns:
+            Array of suppression factors φ^{-(w-2)/2}
+        """
+        weights = np.asarray(weights)
+        if weights.size and weights.min() < 2:
+            raise ValueError("Modular weight must be at least 2")
+        
+        if (np.issubdtype(weights.dtype, np.integer)
+                and (weights.size == 0 or weights.max() - 2 < len(_PHI_POW))):
+            return np.take(_PHI_POW, weights - 2, out=out)
+        
+        return np.power(PHI, -(weights - 2) * 0.5, out=out)
 
 
 class GoldenYukawaMatrix:
@@ -125,47 +504,55 @@ class GoldenYukawaMatrix:
     
     def __init__(self):
         self.forms = A5ModularForms()
+        self._eigensystem = None
         
     def construct_M0(self) -> np.ndarray:
         """
         Construct the universal golden matrix M₀.
         
         Uses Clebsch-Gordan coefficients for 3⊗3 → 5_s
-        and the Y ratios at τ₀.
+        and the Y ratios at τ₀. The matrix is the module constant
+        _M0_CONST, so no work is done per call.
         
         Returns:
-            3x3 symmetric real matrix (Equation 3.2)
+            3x3 symmetric real matrix (Equation 3.2), read-only
         """
-        Y = self.forms.get_Y_ratios()
-        
-        # From Equation (3.1) with Y values substituted
-        sqrt3 = np.sqrt(3)
-        
-        M0 = np.array([
-            [-2/sqrt3,           -1/sqrt3,        -PHI_INV],
-            [-1/sqrt3,      2*PHI_INV/sqrt3,       -PHI_INV2],
-            [-PHI_INV,          -PHI_INV2,   2*PHI_INV2/sqrt3]
-        ])
-        
-        return M0
+        return _M0_CONST
     
     def get_eigenvalues(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Compute eigenvalues and eigenvectors of M₀.
         
+        M₀ is fixed by the constants of the theory, so the result is
+        computed once with the closed-form 3x3 solver and cached.
+        
         Returns:
             (eigenvalues, eigenvectors) sorted by absolute value (descending)
         """
-        M0 = self.construct_M0()
-        
-        eigenvalues, eigenvectors = np.linalg.eigh(M0)
-        
-        # Sort by absolute value, descending
-        idx = np.argsort(np.abs(eigenvalues))[::-1]
-        eigenvalues = eigenvalues[idx]
-        eigenvectors = eigenvectors[:, idx]
+        if self._eigensystem is None:
+            M0 = self.construct_M0()
+            
+            eigenvalues, eigenvectors = _eigh_3x3(M0)
+            
+            # Sort by absolute value, descending: a three-element
+            # compare-swap network instead of a general argsort
+            a, b, c = abs(eigenvalues[0]), abs(eigenvalues[1]), abs(eigenvalues[2])
+            p0, p1, p2 = 0, 1, 2
+            if a < b:
+                a, b, p0, p1 = b, a, p1, p0
+            if b < c:
+                b, c, p1, p2 = c, b, p2, p1
+            if a < b:
+                a, b, p0, p1 = b, a, p1, p0
+            idx = [p0, p1, p2]
+            eigenvalues = eigenvalues[idx]
+            eigenvectors = eigenvectors[:, idx]
+            
+            eigenvalues.setflags(write=False)
+            eigenvectors.setflags(write=False)
+            self._eigensystem = (eigenvalues, eigenvectors)
         
-        return eigenvalues, eigenvectors
+        return self._eigensystem
     
     def verify_golden_hierarchy(self, tolerance: float = 0.05) -> bool:
         """
@@ -204,8 +591,11 @@ class HierarchicalYukawa:
     """
     
     def __init__(self):
-        self.matrix = GoldenYukawaMatrix()
-        self.forms = A5ModularForms()
+        # M₀ depends only on constants of the theory: share the
+        # module-level instances instead of rebuilding them
+        self.matrix = _MATRIX
+        self.forms = _FORMS
+        self.M0 = _M0_CONST
         
     def compute_physical_yukawa(
         self,
@@ -218,25 +608,30 @@ class HierarchicalYukawa:
         From Equation (4.2):
         Y^F_ij = g_F [M₀]_ij φ^{-(k_i + k_j)/2}
         
+        Results are memoized on (weights, coupling) when the weights are
+        integers and coupling is hashable.
+        
         Args:
             weights: Tuple of (k_1, k_2, k_3) modular weights
             coupling: Overall coupling constant g_F
             
         Returns:
-            3x3 physical Yukawa matrix
+            3x3 physical Yukawa matrix, read-only
         """
-        M0 = self.matrix.construct_M0()
-        k1, k2, k3 = weights
-        
-        # Compute suppression matrix
-        k = np.array([k1, k2, k3])
-        k_matrix = k[:, None] + k[None, :]  # k_i + k_j
-        suppression = PHI ** (-k_matrix / 2)
-        
-        # Element-wise multiplication
-        Y_phys = coupling * M0 * suppression
-        
-        return Y_phys
+        try:
+            weights = tuple(operator.index(k) for k in weights)
+        except TypeError:
+            # Non-integer weights take the φ^{-(k_i + k_j)/2} formula, uncached
+            return _physical_yukawa(np.asarray(weights, dtype=float), coupling)
+        
+        # A coupling that cannot be a cache key (e.g. an array) is
+        # computed directly
+        try:
+            hash(coupling)
+        except TypeError:
+            return _physical_yukawa(weights, coupling)
+        
+        return _physical_yukawa_cached(weights, coupling)
     
     def get_mass_hierarchy(
         self,
@@ -251,15 +646,93 @@ class HierarchicalYukawa:
         """
         Y = self.compute_physical_yukawa(weights, coupling)
         
-        # Mass matrix is Y Y†
-        M_mass = Y @ Y.T
-        
-        eigenvalues = np.linalg.eigvalsh(M_mass)
-        masses = np.sqrt(np.abs(eigenvalues))
+        # Mass matrix is Y Y†; Y is symmetric, so its singular values
+        # are |eig(Y)| and Y Y† never needs to be formed
+        masses = np.abs(_eigvalsh_3x3(Y))
         
         # Sort descending
         return np.sort(masses)[::-1]
     
+    def get_mass_hierarchy_batch(
+        self,
+        weights_array: np.ndarray,
+        coupling: float = 1.0,
+        dtype: type = np.float64
+    ) -> np.ndarray:
+        """
+        Get mass eigenvalues for many weight assignments at once.
+        
+        The N Yukawa matrices are stacked into an (N, 3, 3) array and
+        solved in closed form with whole-array operations. Scans of at
+        least _JIT_MIN_ROWS patterns run through the parallel Numba
+        kernel instead when Numba is installed.
+        
+        dtype=np.float32 halves memory traffic for large scans and is
+        always solved in closed form. Errors are then ~1e-6 relative for
+        the Table 2 patterns and scale with the heaviest mass (~1e-5 of
+        m₁ for widely split weights): enough for order-of-magnitude
+        hierarchy tables, not for the values quoted in Appendix C.
+        
+        Args:
+            weights_array: Integer array of shape (N, 3), one (k_1, k_2, k_3)
+                assignment per row
+            coupling: Overall coupling constant g_F
+            dtype: np.float64 (default) or np.float32
+            
+        Returns:
+            Array of shape (N, 3), masses per row sorted descending
+        """
+        ws = WeightScan(weights_array, dtype=dtype)
+        return self.scan(ws, coupling).masses
+    
+    def scan(self, ws: WeightScan, coupling: float = 1.0) -> WeightScan:
+        """
+        Evaluate a weight scan, filling ws.Y, ws.masses and ws.spans in place.
+        
+        Args:
+            ws: Scan whose weights are to be evaluated
+            coupling: Overall coupling constant g_F
+            
+        Returns:
+            The same WeightScan, for chaining
+        """
+        k = ws.weights
+        dtype = ws.Y.dtype
+        
+        # Y is symmetric, so eig(Y Y†) = eig(Y)² and the masses are |eig(Y)|.
+        # Both paths use the closed-form 3x3 solver; LAPACK's per-matrix
+        # dispatch dominates at this size, and single-precision eigh is
+        # unreliable here anyway.
+        kernel = None
+        if (dtype == np.float64 and len(k) >= _JIT_MIN_ROWS
+                and k.min() >= 0 and k.max() < len(_PHI_POW)):
+            kernel = _jit_scan_kernel()
+        
+        if kernel is not None:
+            # The kernel fills ws.Y as it goes, so Y is formed only once
+            eigenvalues = kernel(self.M0, k, _PHI_POW, float(coupling), ws.Y)
+        else:
+            np.multiply(
+                self.M0.astype(dtype, copy=False),
+                _weight_suppression(k).astype(dtype, copy=False),
+                out=ws.Y
+            )
+            ws.Y *= dtype.type(coupling)
+            eigenvalues = _eigvalsh_3x3_batch(ws.Y)
+        
+        # Sort each row descending
+        ws.masses[:] = np.sort(np.abs(eigenvalues), axis=1)[:, ::-1]
+        
+        # Span to the lightest mass above 1e-15 (masses are descending,
+        # so the ones kept form a prefix of each row)
+        n_kept = (ws.masses > 1e-15).sum(axis=1)
+        lightest = ws.masses[np.arange(len(k)), np.maximum(n_kept - 1, 0)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spans = np.log10(ws.masses[:, 0] / lightest)
+        ws.spans[:] = np.where(n_kept >= 2, spans, 0.0)
+        
+        return ws
+    
     def compute_hierarchy_span(
         self,
         weights: Tuple[int, int, int]
@@ -282,27 +755,55 @@ class HierarchicalYukawa:
             return 0.0
         
         return np.log10(masses[0] / masses[-1])
+    
+    def compute_hierarchy_span_batch(self, weights_array: np.ndarray) -> np.ndarray:
+        """
+        Vectorized compute_hierarchy_span over many weight assignments.
+        
+        Args:
+            weights_array: Integer array of shape (N, 3)
+            
+        Returns:
+            Array of N spans log₁₀(m_heaviest/m_lightest)
+        """
+        return self.scan(WeightScan(weights_array), coupling=1.0).spans
+
 
+_PAPER_M0_EIGENVALUES = np.array([-1.4571, 0.3820, 0.2361])
+_PAPER_M0_EIGENVALUES.setflags(write=False)
 
-def get_paper_predictions() -> Dict:
+# Shared by every caller, so read-only throughout like the arrays above
+_PAPER_PREDICTIONS = types.MappingProxyType({
+    'Y_ratios': _Y_RATIOS,
+    'M0_eigenvalues': _PAPER_M0_EIGENVALUES,
+    'golden_ratio': PHI,
+    'tau_0': TAU_0,
+    'hierarchy_patterns': types.MappingProxyType({
+        (6, 4, 0): (1.000, 0.267, 0.191),
+        (8, 4, 0): (1.000, 0.161, 0.132),
+        (10, 6, 0): (1.000, 0.069, 0.058),
+        (4, 2, 0): (1.000, 0.518, 0.388)
+    })
+})
+
+
+def get_paper_predictions() -> Mapping:
     """
     Return key predictions from the paper for comparison.
     
+    The mapping is a module constant built once at import and is
+    read-only, including its nested patterns and arrays; copy it to
+    modify.
+    
     Returns:
-        Dictionary of predicted values
+        Read-only mapping of predicted values
     """
-    return {
-        'Y_ratios': np.array([1.0, PHI_INV, PHI_INV2, -PHI_INV2, -PHI_INV]),
-        'M0_eigenvalues': np.array([-1.4571, 0.3820, 0.2361]),
-        'golden_ratio': PHI,
-        'tau_0': TAU_0,
-        'hierarchy_patterns': {
-            (6, 4, 0): [1.000, 0.267, 0.191],
-            (8, 4, 0): [1.000, 0.161, 0.132],
-            (10, 6, 0): [1.000, 0.069, 0.058],
-            (4, 2, 0): [1.000, 0.518, 0.388]
-        }
-}
+    return _PAPER_PREDICTIONS
+
+
+# Shared instances for HierarchicalYukawa
+_FORMS = A5ModularForms()
+_MATRIX = GoldenYukawaMatrix()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,78 @@
+"""
+Numba-compiled kernels for large weight scans in model.py.
+
+Imported on first use by HierarchicalYukawa.scan for scans of at least
+model._JIT_MIN_ROWS patterns, so importing model never loads Numba.
+Requires Numba; the scalar solver is compiled from the plain-Python
+model._eigvalsh_3x3, so both paths run the same algorithm.
+"""
+
+import numba
+import numpy as np
+
+import model
+
+_eigvalsh_3x3 = numba.njit(cache=True)(model._eigvalsh_3x3)
+
+
+@numba.njit(fastmath=True, cache=True)
+def _yukawa_core(
+    M0: np.ndarray,
+    k: np.ndarray,
+    phi_pow: np.ndarray,
+    coupling: float,
+    out: np.ndarray
+) -> np.ndarray:
+    """
+    Write Y_ij = g_F [M₀]_ij φ^{-(k_i + k_j)/2} into out (Equation 4.2).
+
+    Args:
+        M0: Golden matrix M₀
+        k: Integer weights (k_1, k_2, k_3), entries indexing phi_pow
+        phi_pow: Lookup table φ^{-k/2}
+        coupling: Overall coupling constant g_F
+        out: Float array of shape (3, 3)
+
+    Returns:
+        out
+    """
+    for i in range(3):
+        for j in range(3):
+            out[i, j] = coupling * M0[i, j] * phi_pow[k[i]] * phi_pow[k[j]]
+    return out
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def scan_hierarchy(
+    M0: np.ndarray,
+    weights: np.ndarray,
+    phi_pow: np.ndarray,
+    coupling: float,
+    Y: np.ndarray
+) -> np.ndarray:
+    """
+    Yukawa matrices and their eigenvalues for every weight assignment.
+
+    For each row k of weights, Y[n] = g_F M₀ ∘ (v vᵀ) with v = phi_pow[k]
+    is written into Y, the WeightScan buffer, and then solved. Y is
+    symmetric, so Y Y^T = Y² and the masses are |λ(Y)| without forming
+    the product. The closed-form solver keeps LAPACK out of the loop, so
+    the rows are distributed across cores with prange.
+
+    Args:
+        M0: Golden matrix M₀
+        weights: Integer array of shape (N, 3), entries indexing phi_pow
+        phi_pow: Lookup table φ^{-k/2}
+        coupling: Overall coupling constant g_F
+        Y: Float64 output array of shape (N, 3, 3)
+
+    Returns:
+        Array of shape (N, 3), eigenvalues per row in ascending order
+    """
+    n_patterns = weights.shape[0]
+    out = np.empty((n_patterns, 3))
+
+    for n in numba.prange(n_patterns):
+        out[n] = _eigvalsh_3x3(_yukawa_core(M0, weights[n], phi_pow, coupling, Y[n]))
+
+    return out
@@ -5,31 +5,19 @@ Quick installation and sanity check for Golden Ratio Modular Flavor code.
 Run this after installation to verify everything works.
 """
 
+import importlib.util
 import sys
 
 def test_imports():
     """Test that all required modules can be imported."""
     print("Testing imports...")
-    try:
-        import numpy
-        print("  ✓ numpy")
-    except ImportError as e:
-        print(f"  ✗ numpy: {e}")
-        return False
-    
-    try:
-        import scipy
-        print("  ✓ scipy")
-    except ImportError as e:
-        print(f"  ✗ scipy: {e}")
-        return False
-    
-    try:
-        import matplotlib
-        print("  ✓ matplotlib")
-    except ImportError as e:
-        print(f"  ✗ matplotlib: {e}")
-        return False
+    # Only check that the packages are installed; importing scipy and
+    # matplotlib here would add seconds to a quick sanity check
+    for name in ("numpy", "scipy", "matplotlib"):
+        if importlib.util.find_spec(name) is None:
+            print(f"  ✗ {name}: No module named '{name}'")
+            return False
+        print(f"  ✓ {name}")
     
     try:
         from model import A5ModularForms, GoldenYukawaMatrix, HierarchicalYukawa
@@ -93,6 +81,78 @@ def test_basic_functionality():
         return False
 
 
+def test_closed_form_solvers():
+    """Test the closed-form 3x3 eigensolvers against LAPACK."""
+    print("\nTesting closed-form eigensolvers...")
+    
+    try:
+        from model import (M0_REFERENCE, _eigh_3x3, _eigvalsh_3x3,
+                           _eigvalsh_3x3_batch, _weight_suppression)
+        import numpy as np
+        
+        rng = np.random.default_rng(0)
+        
+        # Eigenvalues alone: random, graded Yukawa-like and degenerate input
+        A = rng.normal(size=(200, 3, 3))
+        Q, _ = np.linalg.qr(rng.normal(size=(200, 3, 3)))
+        d = rng.normal(size=(200, 3))
+        d[:100, 1] = d[:100, 0]
+        d[100:, 1] = d[100:, 0] * (1 + 1e-9 * rng.normal(size=100))
+        cases = {
+            "random": A + A.transpose(0, 2, 1),
+            "graded": M0_REFERENCE * _weight_suppression(rng.integers(0, 61, size=(200, 3))),
+            "degenerate": np.einsum('nij,nj,nkj->nik', Q, d, Q),
+        }
+        for name, Y in cases.items():
+            w_ref = np.linalg.eigvalsh(Y)
+            scale = np.abs(w_ref).max(axis=1, keepdims=True)
+            scalar = np.array([_eigvalsh_3x3(y) for y in Y])
+            err = max((np.abs(scalar - w_ref) / scale).max(),
+                      (np.abs(_eigvalsh_3x3_batch(Y) - w_ref) / scale).max())
+            if err < 1e-12:
+                print(f"  ✓ Eigenvalues match np.linalg.eigvalsh on {name} input (max error {err:.1e})")
+            else:
+                print(f"  ✗ Eigenvalues differ from np.linalg.eigvalsh on {name} input (max error {err:.1e})")
+                return False
+        
+        # Random spectra, plus rotated matrices with a repeated eigenvalue
+        # where the adjugate construction must defer to LAPACK
+        matrices = []
+        for n in range(200):
+            Q, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+            d = rng.normal(size=3)
+            if n % 2:
+                d[1] = d[0]
+            matrices.append(Q @ np.diag(d) @ Q.T)
+        
+        worst = 0.0
+        for M in matrices:
+            M = (M + M.T) / 2
+            w, V = _eigh_3x3(M)
+            w_ref = np.linalg.eigh(M)[0]
+            scale = np.abs(w_ref).max()
+            worst = max(
+                worst,
+                np.abs(w - w_ref).max() / scale,
+                np.abs(M @ V - V * w).max() / scale,
+                np.abs(V.T @ V - np.eye(3)).max()
+            )
+        
+        if worst < 1e-10:
+            print(f"  ✓ Eigendecomposition matches np.linalg.eigh (max error {worst:.1e})")
+        else:
+            print(f"  ✗ Eigendecomposition differs from np.linalg.eigh (max error {worst:.1e})")
+            return False
+        
+        return True
+        
+    except Exception as e:
+        print(f"  ✗ Error during testing: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_verification_script():
     """Test that the verification script can be imported."""
     print("\nTesting verification script...")
@@ -135,6 +195,14 @@ def main():
         else:
             print("\n✓ Functionality test PASSED")
     
+    # Test the closed-form solvers against LAPACK
+    if all_passed:
+        if not test_closed_form_solvers():
+            all_passed = False
+            print("\n✗ Eigensolver test FAILED")
+        else:
+            print("\n✓ Eigensolver test PASSED")
+    
     # Test verification script
     if all_passed:
         if not test_verification_script():
@@ -0,0 +1,512 @@
+"""
+Verification checks for "The Golden Point in A5 Modular Flavor Symmetry"
+
+ResultVerifier reproduces all key numerical results from the paper. The
+command-line interface is verify_results.py.
+"""
+
+import io
+import numpy as np
+from typing import Callable, Dict, Tuple, Union
+import sys
+
+from model import (
+    A5ModularForms,
+    GoldenYukawaMatrix,
+    HierarchicalYukawa,
+    get_paper_predictions,
+    PHI, PHI_INV, PHI_INV2, TAU_0
+)
+
+# Reference values, computed once at import
+_INV_SQRT3 = 1.0 / np.sqrt(3)
+_SUPPRESSION_WEIGHTS = np.array([2, 4, 6, 8, 10])
+_SUPPRESSION_EXPECTED = PHI ** (-(_SUPPRESSION_WEIGHTS - 2) / 2)
+_TAU0_REAL = (np.sqrt(5) - 1) / 4          # Re τ₀ (Equation 1)
+_TAU0_IMAG = np.sqrt((5 + np.sqrt(5)) / 8)  # Im τ₀ (Equation 1)
+_ZETA5_EXPONENTS = np.arange(1, 6)
+_ZETA5_POWERS = np.exp(2j * np.pi * _ZETA5_EXPONENTS / 5)  # ζ₅ᵏ, k = 1..5
+_EXPECTED_Y = np.array([1.0, PHI_INV, PHI_INV2, -PHI_INV2, -PHI_INV])  # Theorem 1
+# Equation 6, in the descending-|λ| order of get_eigenvalues
+_EXPECTED_EIGS = np.array([-1.56426517, 0.99327059, 0.57099458])
+
+# Model objects shared by every ResultVerifier, so repeated verifiers
+# reuse their cached Y ratios, eigensystem and Yukawa matrices
+_FORMS = A5ModularForms()
+_MATRIX = GoldenYukawaMatrix()
+_HIER = HierarchicalYukawa()
+
+
+def _sorted_abs_desc(e: np.ndarray) -> np.ndarray:
+    """Magnitudes of e in descending order, sorted in place as a reversed view."""
+    a = np.abs(e)
+    a.sort()
+    return a[::-1]
+
+
+class ResultVerifier:
+    """Comprehensive verification of paper results."""
+    
+    # Independent elements of M₀ checked against Table 1
+    _M0_ROWS = np.array([0, 0, 0, 1, 1, 2])
+    _M0_COLS = np.array([0, 1, 2, 1, 2, 2])
+    _M0_EXPECTED = np.array([
+        -2*_INV_SQRT3, -_INV_SQRT3, -PHI_INV,
+        2*PHI_INV*_INV_SQRT3, -PHI_INV2, 2*PHI_INV2*_INV_SQRT3
+    ])
+    _M0_LABELS = ("M₁₁", "M₁₂", "M₁₃", "M₂₂", "M₂₃", "M₃₃")
+    
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
+        self.forms = _FORMS
+        self.matrix = _MATRIX
+        self.hierarchical = _HIER
+        
+        # Shared by the verify_* methods; the model returns read-only arrays
+        self._Y = self.forms.get_Y_ratios()
+        self._M0 = self.matrix.construct_M0()
+        self._eig, _ = self.matrix.get_eigenvalues()
+        
+        self._outcomes = []  # pass/fail of every reported result, in order
+        self.corollary_2_passed = None  # set by verify_theorem_1
+        
+        # Scratch buffers for the absolute errors of the tolerance checks
+        self._Y_err = np.empty(len(_EXPECTED_Y))
+        self._M0_err = np.empty(len(self._M0_EXPECTED))
+        self._eig_err = np.empty(len(_EXPECTED_EIGS))
+        
+        # Verbose output is collected here and written once per section;
+        # quiet runs discard it without formatting anything
+        self._buf = io.StringIO()
+        self._write = self._buf.write if verbose else (lambda s: None)
+        
+    @property
+    def passed(self) -> int:
+        """Number of results reported as passing."""
+        return sum(self._outcomes)
+    
+    @property
+    def failed(self) -> int:
+        """Number of results reported as failing."""
+        return len(self._outcomes) - self.passed
+    
+    def _flush(self):
+        """Write the buffered section to stdout in a single call."""
+        if self._buf.tell():
+            sys.stdout.write(self._buf.getvalue())
+            self._buf.seek(0)
+            self._buf.truncate(0)
+        
+    def print_header(self, text: str):
+        """Print section header."""
+        if self.verbose:
+            self._write("\n" + "=" * 70 + "\n")
+            self._write(f"  {text}\n")
+            self._write("=" * 70 + "\n")
+    
+    def print_result(self, test_name: str, passed: bool,
+                     details: Union[str, Callable[[], str]] = ""):
+        """
+        Print test result.
+        
+        details may be a callable returning the string, so that it is only
+        formatted when the result is actually printed.
+        """
+        if self.verbose:
+            status = "✓ PASS" if passed else "✗ FAIL"
+            self._write(f"\n[{status}] {test_name}\n")
+            if callable(details):
+                details = details()
+            if details:
+                self._write(f"  {details}\n")
+        
+        self._outcomes.append(bool(passed))
+    
+    def verify_theorem_1(self) -> bool:
+        """
+        Verify Theorem 1: Y ratios at τ₀ (Section 2.2)
+        
+        Tests that Y_a(τ₀) ∝ (1, φ⁻¹, φ⁻², -φ⁻², -φ⁻¹), then Corollary 2
+        on the same ratios; its outcome is kept in self.corollary_2_passed.
+        """
+        self.print_header("THEOREM 1: Y Ratios at the Golden Point (Section 2.2)")
+        
+        Y = self._Y
+        expected = _EXPECTED_Y
+        
+        if self.verbose:
+            self._write(f"\nGolden ratio φ = {PHI:.15f}\n")
+            self._write(f"φ⁻¹ = {PHI_INV:.15f}\n")
+            self._write(f"φ⁻² = {PHI_INV2:.15f}\n")
+            self._write(f"\nComputed Y ratios:\n")
+            fmt = "  Y_%d = %12.9f  (expected: %12.9f)\n"
+            self._write("".join(
+                fmt % (i, y, e) for i, (y, e) in enumerate(zip(Y, expected), 1)
+            ))
+        
+        # Check agreement to high precision; the maximum is only taken
+        # if the details are printed
+        errors = np.subtract(Y, expected, out=self._Y_err)
+        np.abs(errors, out=errors)
+        passed = bool((errors < 1e-10).all())
+        
+        self.print_result(
+            "Y ratio values",
+            passed,
+            lambda: f"Max error: {errors.max():.2e}"
+        )
+        
+        # Corollary 2 follows from the same Y slice
+        self.verify_corollary_2()
+        
+        self._flush()
+        return passed
+    
+    def verify_corollary_2(self) -> bool:
+        """
+        Verify Corollary 2: Y₄ + Y₅ = -1 (Section 2.2)
+        
+        Also run by verify_theorem_1. The outcome is recorded once and kept
+        in self.corollary_2_passed; later calls return it without counting
+        it again, so the totals do not depend on the order of the checks.
+        """
+        if self.corollary_2_passed is not None:
+            return self.corollary_2_passed
+        
+        Y = self._Y
+        sum_45 = Y[3] + Y[4]  # 0-indexed: Y₄ is index 3
+        
+        error = np.abs(sum_45 + 1.0)
+        passed = error < 1e-10
+        
+        self.print_result(
+            "Corollary 2: Y₄ + Y₅ = -1",
+            passed,
+            lambda: f"Y₄ + Y₅ = {sum_45:.10f}, error = {error:.2e}"
+        )
+        self.corollary_2_passed = passed
+        
+        self._flush()
+        return passed
+    
+    def verify_stabilizer(self) -> bool:
+        """
+        Verify Z₅ stabilizer condition (Section 2.1)
+        """
+        passed = self.forms.stabilizer_condition_holds
+        
+        self.print_result(
+            "Z₅ stabilizer condition",
+            passed,
+            "Y(τ₀) is fixed under the stabilizer group"
+        )
+        
+        self._flush()
+        return passed
+    
+    def verify_M0_matrix(self) -> bool:
+        """
+        Verify M₀ matrix construction (Section 3, Equation 3.2)
+        """
+        self.print_header("GOLDEN MATRIX M₀ (Section 3.2, Equation 3.2)")
+        
+        M0 = self._M0
+        
+        if self.verbose:
+            self._write("\nM₀ matrix:\n")
+            self._write(f"{M0}\n")
+            self._write(f"\nMatrix properties:\n")
+            self._write(f"  Symmetric: {np.allclose(M0, M0.T, rtol=0, atol=1e-12)}\n")
+            self._write(f"  Real: {not np.iscomplexobj(M0) or not M0.imag.any()}\n")
+            self._write(f"  Shape: {M0.shape}\n")
+        
+        # Check symmetry
+        is_symmetric = np.allclose(M0, M0.T, rtol=0, atol=1e-12)
+        self.print_result("M₀ is symmetric", is_symmetric)
+        
+        # Check reality
+        # A real dtype needs no elementwise check
+        is_real = not np.iscomplexobj(M0) or bool((np.abs(M0.imag) < 1e-10).all())
+        self.print_result("M₀ is real", is_real)
+        
+        # Verify specific elements match Table 1
+        computed = M0[self._M0_ROWS, self._M0_COLS]
+        errors = np.subtract(computed, self._M0_EXPECTED, out=self._M0_err)
+        np.abs(errors, out=errors)
+        all_match = bool((errors < 1e-10).all())
+        
+        if self.verbose:
+            fmt = "  %s = %.6f (expected %.6f)\n"
+            self._write("".join(
+                fmt % row for row in zip(self._M0_LABELS, computed, self._M0_EXPECTED)
+            ))
+        
+        self.print_result("M₀ elements match Table 1", all_match)
+        
+        self._flush()
+        return is_symmetric and is_real and all_match
+    
+    def verify_eigenvalues(self) -> bool:
+        """
+        Verify eigenvalue analysis (Section 3.3, Equation 6)
+        """
+        self.print_header("EIGENVALUE ANALYSIS (Section 3.3)")
+        
+        eigenvalues = self._eig
+        
+        # Expected from paper (Equation 6)
+        expected = _EXPECTED_EIGS
+        
+        if self.verbose:
+            self._write("\nEigenvalues:\n")
+            fmt = "  λ_%d = %10.6f  (paper: %10.6f)\n"
+            self._write("".join(
+                fmt % (i, computed, exp)
+                for i, (computed, exp) in enumerate(zip(eigenvalues, expected), 1)
+            ))
+        
+        # Check agreement (paper gives 3 decimal places)
+        errors = np.subtract(eigenvalues, expected, out=self._eig_err)
+        np.abs(errors, out=errors)
+        passed = bool((errors < 0.001).all())  # Match to paper's precision
+        
+        self.print_result(
+            "Eigenvalue magnitudes",
+            passed,
+            lambda: f"Max error: {errors.max():.4f}"
+        )
+        
+        self._flush()
+        return passed
+    
+    def verify_golden_hierarchy(self) -> bool:
+        """
+        Verify golden ratio hierarchy in eigenvalues (Section 3.3)
+        """
+        passed = self.matrix.verify_golden_hierarchy(tolerance=0.05)
+        
+        lam = np.abs(self._eig)
+        
+        if self.verbose:
+            self._write("\nGolden hierarchy check:\n")
+            self._write(f"  |λ₁| : |λ₂| : |λ₃| = 1 : {lam[1]/lam[0]:.3f} : {lam[2]/lam[0]:.3f}\n")
+            self._write(f"  Expected:  1 : {PHI_INV:.3f} : {PHI_INV2:.3f}\n")
+            self._write(f"  (1 : φ⁻¹ : φ⁻²)\n")
+        
+        self.print_result(
+            "Golden hierarchy λ₁:λ₂:λ₃ ∼ 1:φ⁻¹:φ⁻²",
+            passed
+        )
+        
+        self._flush()
+        return passed
+    
+    def verify_modular_weight_suppression(self) -> bool:
+        """
+        Verify modular weight suppression (Section 2.3, Equation 2.7)
+        """
+        self.print_header("MODULAR WEIGHT SUPPRESSION (Section 2.3)")
+        
+        if self.verbose:
+            self._write("\nSuppression factors φ^{-(w-2)/2}:\n")
+            self._write(f"  Weight  Suppression\n")
+            self._write(f"  ------  -----------\n")
+        
+        computed = self.forms.suppression_array(_SUPPRESSION_WEIGHTS)
+        
+        passed = bool((np.abs(computed - _SUPPRESSION_EXPECTED) < 1e-10).all())
+        
+        if self.verbose:
+            fmt = "    %2d     %.6f  (φ^%s)\n"
+            self._write("".join(
+                fmt % (w, value, -(w-2)/2)
+                for w, value in zip(_SUPPRESSION_WEIGHTS.tolist(), computed)
+            ))
+        
+        self.print_result(
+            "Weight suppression formula",
+            passed
+        )
+        
+        self._flush()
+        return passed
+    
+    def verify_hierarchical_patterns(self) -> bool:
+        """
+        Verify hierarchical patterns from Table 2 (Section 4)
+        """
+        self.print_header("HIERARCHICAL PATTERNS (Section 4, Table 2)")
+        
+        predictions = get_paper_predictions()
+        patterns = predictions['hierarchy_patterns']
+        
+        if self.verbose:
+            self._write("\nWeight Assignment → Yukawa Ratios:\n")
+            self._write("(k₁, k₂, k₃)  →  y₁ : y₂ : y₃\n")
+            self._write("-" * 50 + "\n")
+        
+        # All weight assignments in one batched evaluation
+        masses = self.hierarchical.get_mass_hierarchy_batch(np.array(list(patterns)), coupling=1.0)
+        
+        # Normalize to heaviest
+        ratios = masses / masses[:, :1]
+        
+        # Expected (from paper Table 2)
+        expected = np.array(list(patterns.values()))
+        
+        # Check agreement (10% tolerance due to approximate paper values)
+        rel_errors = ratios - expected
+        np.abs(rel_errors, out=rel_errors)
+        rel_errors /= expected
+        all_passed = bool((rel_errors < 0.15).all())
+        
+        if self.verbose:
+            fmt = ("%s → %.3f : %.3f : %.3f\n"
+                   "              (expected: %.3f : %.3f : %.3f)\n")
+            self._write("".join(
+                fmt % ((str(weights),) + tuple(r) + tuple(e))
+                for weights, r, e in zip(patterns, ratios, expected)
+            ))
+        
+        self.print_result(
+            "Hierarchical patterns match Table 2",
+            all_passed
+        )
+        
+        self._flush()
+        return all_passed
+    
+    def verify_tau_0_properties(self) -> bool:
+        """
+        Verify properties of τ₀ = exp(2πi/5) (Section 2.1)
+        """
+        self.print_header("GOLDEN POINT τ₀ PROPERTIES (Section 2.1)")
+        
+        tau = self.forms.tau_0.tau
+        
+        if self.verbose:
+            self._write(f"\nτ₀ = exp(2πi/5)\n")
+            self._write(f"   = {tau.real:.10f} + {tau.imag:.10f}i\n")
+            self._write(f"\nExpected (Equation 1):\n")
+            self._write(f"   Real part = (√5-1)/4 = {_TAU0_REAL:.10f}\n")
+            self._write(f"   Imag part = √(5+√5)/8 = {_TAU0_IMAG:.10f}\n")
+        
+        # Verify τ₀ᵏ = ζ₅ᵏ for k = 1..5 with one power evaluation,
+        # which includes τ₀² = exp(4πi/5) and τ₀⁵ = 1
+        errors = np.abs(tau ** _ZETA5_EXPONENTS - _ZETA5_POWERS)
+        error_squared = errors[1]
+        
+        passed_squared = error_squared < 1e-10
+        self.print_result(
+            "τ₀² = ζ₅²",
+            passed_squared,
+            lambda: f"Error: {error_squared:.2e}"
+        )
+        
+        passed_powers = bool((errors < 1e-10).all())
+        self.print_result(
+            "τ₀ᵏ = ζ₅ᵏ for k = 1..5 (τ₀⁵ = 1)",
+            passed_powers,
+            lambda: f"Max error: {errors.max():.2e}"
+        )
+        
+        # Verify τ₀ is in upper half-plane
+        passed_uhp = tau.imag > 0
+        self.print_result(
+            "τ₀ in upper half-plane",
+            passed_uhp,
+            lambda: f"Im(τ₀) = {tau.imag:.6f} > 0"
+        )
+        
+        self._flush()
+        return passed_squared and passed_powers and passed_uhp
+    
+    def run_all_tests(self) -> Dict[str, bool]:
+        """
+        Run complete verification suite.
+        
+        Returns:
+            Dictionary mapping test names to pass/fail status
+        """
+        sys.stdout.write(
+            "\n" + "=" * 70 + "\n"
+            "  GOLDEN RATIO MODULAR FLAVOR SYMMETRY\n"
+            "  Complete Verification Suite\n"
+            + "=" * 70 + "\n"
+        )
+        
+        results = self._run_checks()
+        
+        # Summary
+        self.print_header("VERIFICATION SUMMARY")
+        self._flush()
+        
+        total = len(self._outcomes)
+        passed = sum(self._outcomes)
+        failed = total - passed
+        summary = [
+            f"\nTotal tests: {total}",
+            f"Passed: {passed}",
+            f"Failed: {failed}",
+            f"Success rate: {100*passed/total:.1f}%",
+        ]
+        if failed == 0:
+            summary.append("\n✓ All verifications passed!")
+        else:
+            summary.append(f"\n✗ {failed} verification(s) failed")
+        summary.append("=" * 70 + "\n")
+        sys.stdout.write("\n".join(summary) + "\n")
+        
+        return results
+    
+    def brief_report(self) -> Dict[str, bool]:
+        """
+        Run the checks and print a compact summary table.
+        
+        The key quantities are read from the cached self._Y, self._M0 and
+        self._eig; construct the verifier with verbose=False so that only
+        the table is printed.
+        
+        Returns:
+            Dictionary mapping test names to pass/fail status
+        """
+        results = self._run_checks()
+        
+        mags = _sorted_abs_desc(self._eig)
+        ratios = mags[1:] / mags[0]
+        lines = [
+            "Golden point τ₀ = exp(2πi/5), φ = %.9f" % PHI,
+            "Y ratios:   " + " ".join("%10.6f" % y for y in self._Y),
+            "M₀ diag:    " + " ".join("%10.6f" % m for m in self._M0.diagonal()),
+            "M₀ eigvals: " + " ".join("%10.6f" % e for e in self._eig),
+            "|λ| ratios: 1 : %.3f : %.3f  (1 : φ⁻¹ : φ⁻² = 1 : %.3f : %.3f)"
+            % (ratios[0], ratios[1], PHI_INV, PHI_INV2),
+            "",
+        ]
+        lines += ["  [%s] %s" % ("PASS" if ok else "FAIL", name)
+                  for name, ok in results.items()]
+        lines.append("%d/%d checks passed" % (sum(self._outcomes), len(self._outcomes)))
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        return results
+    
+    def _run_checks(self) -> Dict[str, bool]:
+        """Run every verify_* check, returning the results dictionary."""
+        results = {}
+        
+        # Section 2: Modular forms at golden point
+        results['tau_0_properties'] = self.verify_tau_0_properties()
+        results['theorem_1'] = self.verify_theorem_1()
+        results['corollary_2'] = self.corollary_2_passed
+        results['stabilizer'] = self.verify_stabilizer()
+        results['weight_suppression'] = self.verify_modular_weight_suppression()
+        
+        # Section 3: Yukawa matrix
+        results['M0_matrix'] = self.verify_M0_matrix()
+        results['eigenvalues'] = self.verify_eigenvalues()
+        results['golden_hierarchy'] = self.verify_golden_hierarchy()
+        
+        # Section 4: Hierarchical structure
+        results['hierarchical_patterns'] = self.verify_hierarchical_patterns()
+        
+        return results